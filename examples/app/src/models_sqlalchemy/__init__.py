@@ -0,0 +1,23 @@
+from .article import Article, Status
+from .article_user import ArticleUser
+from .article_user import Role as ArticleRole
+from .base import Base
+from .engine import make_async_engine, make_engine
+from .media import Media
+from .user import User
+from .user_media_role import Role as MediaRole
+from .user_media_role import UserMediaRole
+
+__all__ = [
+    "Article",
+    "ArticleRole",
+    "ArticleUser",
+    "Base",
+    "Media",
+    "MediaRole",
+    "Status",
+    "User",
+    "UserMediaRole",
+    "make_async_engine",
+    "make_engine",
+]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(AsyncAttrs, DeclarativeBase):
+    """Shared declarative base for all models.
+
+    One registry and one MetaData, so cross-table ForeignKey("user.id")
+    references resolve and create_all() emits a single pass. AsyncAttrs
+    makes lazy attribute loads awaitable under AsyncSession.
+    """
@@ -1,25 +1,54 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Uuid, text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, String, Text, Uuid, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
+from .base import Base
+from .user import User
 
-class Media(DeclarativeBase):
+
+class Media(Base):
     __tablename__ = "media"
 
     # hello
-    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, server_default=text("gen_random_uuid()"))
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    logo: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="assets")
+    logo: Mapped[Optional[str]] = mapped_column(Text(collation="C"), nullable=True, deferred=True, deferred_group="assets")
     owner_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("user.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, insert_default=lambda: datetime.now(UTC))
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    owner: Mapped[User] = relationship(lazy="selectin")
+
     __table_args__ = (
         Index(None, "owner_id"),
+        Index("ix_media_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
+
+
+# Logos are already-compressed images serialized as text; skip LZ compression.
+event.listen(
+    Media.__table__,
+    "after_create",
+    DDL("ALTER TABLE media ALTER COLUMN logo SET STORAGE EXTERNAL").execute_if(dialect="postgresql"),
+)
+
+# Compiled once at import so hot-path inserts skip the statement builder.
+MEDIA_INSERT = Media.__table__.insert().compile(dialect=postgresql.dialect())
+MEDIA_INSERT_STR = str(MEDIA_INSERT)
+
+
+def bulk_insert(conn, rows: list[dict]) -> None:
+    """Insert pre-shaped rows through the precompiled statement.
+
+    conn.exec_driver_sql() hands the frozen SQL plus the row dicts
+    straight to the driver's executemany, bypassing per-call compilation.
+    """
+    conn.exec_driver_sql(MEDIA_INSERT_STR, rows)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import enum
+
+from sqlalchemy import SmallInteger, TypeDecorator
+
+
+class IntEnumType(TypeDecorator):
+    """SmallInteger-backed codec for IntEnum columns.
+
+    SQLAlchemy's Enum type runs isinstance and membership validation on
+    every value in the row processor; on bulk fetches that is a Python
+    branch per row. This decorator does a single int() on bind and one
+    enum lookup on fetch, and cache_ok=True keeps it from defeating the
+    compiled-query cache.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[enum.IntEnum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.enum_cls(value)
@@ -1,30 +1,57 @@
 from __future__ import annotations
 
 import enum
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Uuid, text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Uuid
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
+from .base import Base
+from .types import IntEnumType
 
-class Role(str, enum.Enum):
-    OWNER = "owner"
-    EDITOR = "editor"
-    REPORTER = "reporter"
 
-class UserMediaRole(DeclarativeBase):
+class Role(enum.IntEnum):
+    OWNER = 0
+    EDITOR = 1
+    REPORTER = 2
+
+class UserMediaRole(Base):
     """hello media role"""
     __tablename__ = "user_media_role"
 
     # hello
     user_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("user.id"), primary_key=True)
     media_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("media.id"), primary_key=True)
-    role: Mapped[Role] = mapped_column(Enum(Role), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    role: Mapped[Role] = mapped_column(IntEnumType(Role), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, insert_default=lambda: datetime.now(UTC))
 
     __table_args__ = (
-        Index(None, "user_id"),
-        Index(None, "media_id"),
-        Index(None, "role"),
+        CheckConstraint("role BETWEEN 0 AND 2"),
+        Index("ix_umr_user_role", "user_id", "role"),
+        Index("ix_umr_media_role", "media_id", "role"),
+        Index("ix_umr_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
+
+
+def bulk_upsert(session: Session, rows: list[dict], batch: int = 2047) -> None:
+    """Insert memberships in one round-trip per batch.
+
+    Use this instead of per-row session.add() loops: each batch becomes a
+    single multi-VALUES INSERT ... ON CONFLICT DO NOTHING, so one
+    round-trip and one WAL flush cover the whole batch. batch=2047 keeps
+    bind-parameter count under the 65535 wire limit.
+    """
+    for i in range(0, len(rows), batch):
+        stmt = (
+            pg_insert(UserMediaRole)
+            .values(rows[i : i + batch])
+            .on_conflict_do_nothing(index_elements=["user_id", "media_id"])
+        )
+        session.execute(stmt)
+
+# Compiled once at import so hot-path inserts skip the statement builder.
+USER_MEDIA_ROLE_INSERT = UserMediaRole.__table__.insert().compile(dialect=postgresql.dialect())
+USER_MEDIA_ROLE_INSERT_STR = str(USER_MEDIA_ROLE_INSERT)
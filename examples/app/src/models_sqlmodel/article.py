@@ -6,7 +6,7 @@ from typing import Optional
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import text
+from sqlalchemy import Index, text
 
 
 class Status(str, enum.Enum):
@@ -24,7 +24,14 @@ class Article(SQLModel, table=True):
     content: str = Field(...)
     summary: Optional[str] = Field(default=None)
     thumbnail: Optional[str] = Field(default=None)
-    status: Status = Field(default="draft", index=True)
-    published_at: Optional[datetime] = Field(default=None, index=True)
+    status: Status = Field(default="draft")
+    published_at: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(sa_column_kwargs={"server_default": text("now()")})
     updated_at: Optional[datetime] = Field(default=None)
+
+    __table_args__ = (
+        Index("ix_article_status_pub", "status", text("published_at DESC NULLS LAST")),
+        # The Enum column persists member names (labels 'DRAFT'..'ARCHIVED'),
+        # not the lowercase values, so the predicate must use the label.
+        Index("ix_article_published_live", "published_at", postgresql_where=text("status = 'PUBLISHED'")),
+    )
@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import text
+from sqlalchemy import Index, text
 
 
 class Role(str, enum.Enum):
@@ -15,9 +15,13 @@ class Role(str, enum.Enum):
 class ArticleUser(SQLModel, table=True):
     __tablename__ = "article_user"
 
+    user_id: UUID = Field(primary_key=True, foreign_key="user.id")
     media_id: UUID = Field(primary_key=True)
     article_id: int = Field(primary_key=True)
-    user_id: UUID = Field(primary_key=True, foreign_key="user.id")
     author_order: int = Field(default=1)
     role: Role = Field(default="contributor")
     created_at: datetime = Field(sa_column_kwargs={"server_default": text("now()")})
+
+    __table_args__ = (
+        Index("ix_au_article", "media_id", "article_id"),
+    )
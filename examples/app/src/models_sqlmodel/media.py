@@ -6,13 +6,14 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 from sqlalchemy import text
+from uuid_utils.compat import uuid7
 
 
 class Media(SQLModel, table=True):
     __tablename__ = "media"
 
     # hello
-    id: UUID = Field(sa_column_kwargs={"server_default": text("gen_random_uuid()")}, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     name: str = Field(...)
     description: Optional[str] = Field(default=None)
     logo: Optional[str] = Field(default=None)
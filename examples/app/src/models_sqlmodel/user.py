@@ -6,12 +6,13 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 from sqlalchemy import text
+from uuid_utils.compat import uuid7
 
 
 class User(SQLModel, table=True):
     __tablename__ = "user"
 
-    id: UUID = Field(sa_column_kwargs={"server_default": text("gen_random_uuid()")}, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     email: str = Field(unique=True, index=True)
     password: str = Field(...)
     name: str = Field(...)
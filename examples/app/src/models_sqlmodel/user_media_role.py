@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import text
+from sqlalchemy import Index, text
 
 
 class Role(str, enum.Enum):
@@ -20,5 +20,10 @@ class UserMediaRole(SQLModel, table=True):
     # hello
     user_id: UUID = Field(primary_key=True, foreign_key="user.id")
     media_id: UUID = Field(primary_key=True, foreign_key="media.id")
-    role: Role = Field(index=True)
+    role: Role = Field(...)
     created_at: datetime = Field(sa_column_kwargs={"server_default": text("now()")})
+
+    __table_args__ = (
+        Index("ix_umr_user_role", "user_id", "role"),
+        Index("ix_umr_media_role", "media_id", "role"),
+    )